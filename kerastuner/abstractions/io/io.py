@@ -124,8 +124,7 @@ def write_file(path, contents):
       path: string, name of the file to write.
       contents: string, contents to write to the file.
     """
-    with tf.io.gfile.Open(path, 'w') as output:
-        output.write(contents)
+    tf_utils.write_file(path, contents)
 
 
 def read_file(path, binary_mode=False):
@@ -18,6 +18,7 @@ import json
 import os
 import subprocess
 import sys
+import uuid
 
 import numpy as np
 import tensorflow as tf
@@ -124,6 +125,20 @@ class GFileProxy(object):
             errors.OpError: If the operation fails.
         """
 
+    @abstractmethod
+    def rename(self, src, dst, overwrite=False):
+        """Renames or moves a file.
+
+        Args:
+            src: string, name of the file to rename
+            dst: string, new name of the file
+            overwrite: boolean, if false its an error for
+                dst to be occupied by an existing file.
+
+        Raises:
+            errors.OpError: If the operation fails.
+        """
+
 
 class IOProxy(object):
     """Proxy for tf.io. In general, the GFile module is redirected to a
@@ -456,8 +471,27 @@ class UtilsBase(object):
         """
 
     def write_file(self, path, contents):
-        with self.tf_proxy.io.gfile.Open(path, 'w') as output:
-            output.write(contents)
+        if '://' in str(path):
+            # Renames on remote filesystems (e.g. GCS) are a copy plus a
+            # delete, so writing through a temporary file gains nothing.
+            with self.tf_proxy.io.gfile.Open(path, 'w') as output:
+                output.write(contents)
+            return
+        # On local filesystems, write to a temporary file and rename it into
+        # place, so that readers never see a partially written file.
+        tmp_path = '%s.tmp-%s' % (path, uuid.uuid4().hex)
+        try:
+            with self.tf_proxy.io.gfile.Open(tmp_path, 'w') as output:
+                output.write(contents)
+            self.tf_proxy.io.gfile.rename(tmp_path, path, overwrite=True)
+        except Exception:
+            try:
+                if self.tf_proxy.io.gfile.exists(tmp_path):
+                    self.tf_proxy.io.gfile.remove(tmp_path)
+            except Exception:
+                # Don't mask the original write or rename error.
+                pass
+            raise
 
     def read_file(self, path, mode='r'):
         with self.tf_proxy.io.gfile.Open(path, mode) as i:
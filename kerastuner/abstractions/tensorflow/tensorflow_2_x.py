@@ -123,6 +123,20 @@ class GFileProxy_2_x(proxy.GFileProxy):
         """
         return tf.io.gfile.copy(src, dst, overwrite=overwrite)
 
+    def rename(self, src, dst, overwrite=False):
+        """Renames or moves a file.
+
+        Args:
+        src: string, name of the file to rename
+        dst: string, new name of the file
+        overwrite: boolean, if false its an error for dst
+            to be occupied by an existing file.
+
+        Raises:
+        errors.OpError: If the operation fails.
+        """
+        return tf.io.gfile.rename(src, dst, overwrite=overwrite)
+
     def __getattr__(self, name):
         return getattr(gfile, name)
 
@@ -48,7 +48,7 @@ class HyperbandOracle(oracle_module.Oracle):
             raise ValueError('max_epochs needs to be larger than min_epochs.')
         if factor < 2:
             raise ValueError('factor needs to be a int larger than 1.')
-        self.seed = seed or random.randint(1, 1e4)
+        self.seed = seed or random.randint(1, int(1e4))
         self.factor = factor
         self.min_epochs = min_epochs
         self.max_epochs = max_epochs
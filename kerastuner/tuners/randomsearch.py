@@ -31,7 +31,7 @@ class RandomSearchOracle(oracle_module.Oracle):
 
     def __init__(self, seed=None):
         super(RandomSearchOracle, self).__init__()
-        self.seed = seed or random.randint(1, 1e4)
+        self.seed = seed or random.randint(1, int(1e4))
         # Incremented at every call to `populate_space`.
         self._seed_state = self.seed
         # Hashes of values tried so far.
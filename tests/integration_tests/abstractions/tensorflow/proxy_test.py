@@ -14,6 +14,7 @@
 
 import json
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -298,3 +299,22 @@ def test_save_tf_lite(
 
                 assert np.allclose(orig_out[0][i], o1)
                 assert np.allclose(orig_out[1][i], o2)
+
+
+def test_write_file_overwrites_and_leaves_no_temp_file(tmp_path):
+    fname = os.path.join(str(tmp_path), "state.json")
+    tf_utils.write_file(fname, json.dumps({"a": 1}))
+    tf_utils.write_file(fname, json.dumps({"a": 2}))
+
+    assert json.loads(tf_utils.read_file(fname)) == {"a": 2}
+    assert os.listdir(str(tmp_path)) == ["state.json"]
+
+
+def test_write_file_removes_temp_file_on_failure(tmp_path):
+    fname = os.path.join(str(tmp_path), "state.json")
+    with mock.patch.object(tf_utils.tf_proxy.io.gfile, "rename",
+                           side_effect=IOError("rename failed")):
+        with pytest.raises(IOError):
+            tf_utils.write_file(fname, json.dumps({"a": 1}))
+
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,24 @@
+# Copyright 2019 The Keras Tuner Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from kerastuner.engine import tuner_utils
+
+
+@pytest.mark.filterwarnings('error::DeprecationWarning')
+def test_generate_trial_id():
+    trial_id = tuner_utils.generate_trial_id()
+    assert len(trial_id) == 32
+    assert trial_id != tuner_utils.generate_trial_id()
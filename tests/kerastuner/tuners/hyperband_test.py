@@ -31,6 +31,12 @@ def tmp_dir(tmpdir_factory):
     return tmpdir_factory.mktemp('integration_test')
 
 
+@pytest.mark.filterwarnings('error::DeprecationWarning')
+def test_hyperband_oracle_default_seed():
+    oracle = hyperband_module.HyperbandOracle()
+    assert isinstance(oracle.seed, int)
+
+
 def test_hyperband_oracle(tmp_dir):
     hp_list = [hp_module.Choice('a', [1, 2], default=1),
                hp_module.Choice('b', [3, 4], default=3),
@@ -13,3 +13,19 @@
 # limitations under the License.
 
 import pytest
+
+from kerastuner.engine import hyperparameters as hp_module
+from kerastuner.tuners import randomsearch as randomsearch_module
+
+
+@pytest.mark.filterwarnings('error::DeprecationWarning')
+def test_random_search_oracle():
+    hp_list = [hp_module.Choice('a', [1, 2], default=1),
+               hp_module.Range('b', 0, 10, default=3)]
+    oracle = randomsearch_module.RandomSearchOracle()
+    assert isinstance(oracle.seed, int)
+
+    hp = oracle.populate_space('0', hp_list)
+    assert hp['status'] == 'RUN'
+    assert hp['values']['a'] in [1, 2]
+    assert 0 <= hp['values']['b'] < 10